@@ -5,27 +5,40 @@ lexical analysis, parsing, standardization, and execution of RPAL programs.
 """
 
 import argparse
+import contextlib
+import io
+import sys
+import traceback
 from src.lexer import Lexer
 from src.parser import Parser
 from src.standerizer.ast import AST
 from src.standerizer.node import Node
 from src.standerizer import ast_factory
-from src.lcrs_to_nary_convertor import lcrs_to_nary
-from src.rpal_ast import print_ast
-from src.nary_to_lcrs_convertor import nary_to_lcrs
+from src.ast_canonicalize import canonicalize
 from src.cse_machine.machine import CSEMachine
+from src.cse_machine.data_structures.enviroment import Environment
 
-def main():
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description="RPAL Language Interpreter")
-    parser.add_argument("filename", help="Input RPAL program file")
-    parser.add_argument("-ast", action="store_true", help="Print original AST only")
-    parser.add_argument("-st", action="store_true", help="Print standardized AST only")
-    args = parser.parse_args()
+# Batch mode protocol: every program's output is followed by the record separator,
+# and the output of a failed program is replaced by the error marker and its traceback
+BATCH_SEPARATOR = "\x1e"
+BATCH_ERROR = "\x15"
 
-    # Read source code from file
-    with open(args.filename, "r") as file:
-        source_code = file.read()
+def run_program(filename, ast_only=False, st_only=False):
+    """
+    Runs one RPAL program and writes its output to stdout.
+
+    Args:
+        filename: Path of the RPAL program file
+        ast_only: Print the original AST instead of running the program
+        st_only: Print the standardized AST instead of running the program
+    """
+    # Read source code from file, decoding it in one step
+    with open(filename, "rb") as file:
+        source_code = file.read().decode("utf-8")
+
+    # Normalize line endings the way text mode would
+    if "\r" in source_code:
+        source_code = source_code.replace("\r\n", "\n").replace("\r", "\n")
 
     # Lexical Analysis: Convert source code to tokens
     lexer = Lexer(source_code)
@@ -34,37 +47,79 @@ def main():
     # Syntax Analysis: Build Abstract Syntax Tree
     parser = Parser(tokens)
     ast_root = parser.parse()
+    ast_obj = AST(ast_root)
 
     # Option 1: Print original AST and exit
-    if args.ast:
-        print_ast(ast_root)
+    if ast_only:
+        ast_obj.print_ast()
         return
 
-    # Convert LCRS AST to n-ary tree for standardization
-    nary_root = lcrs_to_nary(ast_root)
-    ast_obj = AST(nary_root)
+    # Fold literal arithmetic when the program is executed; the printed
+    # trees are left as written so they match the original interpreter
+    if not st_only:
+        canonicalize(ast_root)
 
     # Standardize the AST according to RPAL rules
     ast_obj.standardize()
 
     # Option 2: Print standardized AST and exit
-    if args.st:
+    if st_only:
         ast_obj.print_ast()
         return
 
-    # Convert standardized AST back to LCRS format
-    # st_lcrs_root = nary_to_lcrs(ast_obj.root)
-    
-    # Convert to n-ary format for CSE machine execution
-    # st_nary_root = lcrs_to_nary(st_lcrs_root)
-    
-    # Execute the program using CSE machine
+    # Execute the standardized n-ary tree directly using CSE machine
     cse_machine = CSEMachine()
     cse_machine.execute(ast_obj.root)
-    
+
     # Print the program output
     print(cse_machine._generate_output())
 
+def run_batch(ast_only=False, st_only=False):
+    """
+    Runs every program whose path is read from stdin, one path per line, in this process.
+    Each program's output is written as one record terminated by BATCH_SEPARATOR,
+    so a caller can run many programs without starting an interpreter for each.
+
+    Args:
+        ast_only: Print the original AST of each program instead of running it
+        st_only: Print the standardized AST of each program instead of running it
+    """
+    for line in sys.stdin:
+        filename = line.rstrip("\n")
+        if not filename:
+            continue
+
+        # Environment numbering is global to the process; start each program from e0
+        Environment.index = -1
+
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                run_program(filename, ast_only, st_only)
+            record = output.getvalue()
+        except Exception:
+            record = BATCH_ERROR + traceback.format_exc()
+
+        sys.stdout.write(record + BATCH_SEPARATOR)
+        sys.stdout.flush()
+
+def main():
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="RPAL Language Interpreter")
+    parser.add_argument("filename", nargs="?", help="Input RPAL program file")
+    parser.add_argument("-ast", action="store_true", help="Print original AST only")
+    parser.add_argument("-st", action="store_true", help="Print standardized AST only")
+    parser.add_argument("--batch", action="store_true",
+                        help="Run the program files listed on stdin, one path per line")
+    args = parser.parse_args()
+
+    if args.batch:
+        run_batch(args.ast, args.st)
+    elif args.filename is None:
+        parser.error("the following arguments are required: filename")
+    else:
+        run_program(args.filename, args.ast, args.st)
+
 
 if __name__ == "__main__":
     main()
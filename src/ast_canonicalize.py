@@ -0,0 +1,62 @@
+"""
+Canonicalizing rewrites applied to the AST before standardization.
+Folds integer additions and subtractions of literals and removes double negations
+of integer literals, so the standardizer and the CSE machine walk a smaller tree.
+"""
+
+# Binary operators folded when both operands are integer literals
+_FOLDABLE = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+}
+
+def _int_value(node):
+    """Returns the value of an integer literal leaf, or None for any other node."""
+    if not node.children and node.data.startswith('<INT:'):
+        return int(node.data[5:-1])
+    return None
+
+def canonicalize(root):
+    """
+    Rewrites the tree in place, replacing foldable subtrees with integer literals.
+    Nodes are collected in pre-order with an explicit stack and rewritten in reverse,
+    so every node is visited after its children and nested expressions fold fully.
+
+    Args:
+        root: Root node of the tree
+
+    Returns:
+        Node: Root of the rewritten tree
+    """
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(node.children)
+
+    for node in reversed(order):
+        data = node.data
+        children = node.children
+        if data in _FOLDABLE:
+            # <INT:a> + <INT:b>  =>  <INT:a+b>
+            if len(children) != 2:
+                continue
+            a = _int_value(children[0])
+            b = _int_value(children[1])
+            if a is None or b is None:
+                continue
+            node.data = f"<INT:{_FOLDABLE[data](a, b)}>"
+            node.children = []
+
+        elif data == 'neg':
+            # neg neg <INT:n>  =>  <INT:n>
+            if len(children) != 1 or children[0].data != 'neg' or len(children[0].children) != 1:
+                continue
+            operand = children[0].children[0]
+            if _int_value(operand) is None:
+                continue
+            node.data = operand.data
+            node.children = []
+
+    return root
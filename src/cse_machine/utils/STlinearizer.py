@@ -27,6 +27,7 @@ class Linearizer:
         Initialize the linearizer.
         """
         self.control_structures = []
+        self._filter_cache = {}    # label -> filtered [type, value] pair
         
     def linearize(self,st_tree):
         """
@@ -96,6 +97,7 @@ class Linearizer:
     def filter(self,token):
         """
         Filter the input tokens.
+        Results are memoized per label, since the same leaf labels recur throughout a tree.
 
         Args:
             token (str): The input token.
@@ -103,6 +105,10 @@ class Linearizer:
         Returns:
             list[str]: The filtered tokens.
         """
+        output = self._filter_cache.get(token)
+        if output is not None:
+            return output
+
         output = list()
         if token[0] == "<":
                 if len(token)>3 and token[1:3] == "ID":
@@ -124,6 +130,7 @@ class Linearizer:
                     output = [token[1:-1], token[1:-1]]
         else:
             output = [token, token]
+        self._filter_cache[token] = output
         return output
     
     ################################################################################################
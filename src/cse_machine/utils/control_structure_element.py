@@ -1,4 +1,6 @@
 class ControlStructureElement:
+    __slots__ = ('type', 'value', 'bounded_variable', 'control_structure', 'env', 'operator')
+
     def __init__(self, type, value, bounded_variable=None,control_structure=None, env=None , operator=None):
         self.type = type
         self.value = value
@@ -2,39 +2,57 @@
 Converts a Left-Child Right-Sibling (LCRS) tree structure to an N-ary tree structure.
 LCRS representation uses left pointer for first child and right pointer for next sibling,
 while N-ary representation uses a list of children for each node.
+
+Deprecated: the parser builds the n-ary tree directly, so no stage of myrpal.py
+converts from LCRS. Kept for external callers only.
 """
 
+import warnings
+
 from src.rpal_ast import ASTNode
 from src.standerizer.node import Node
 
 def lcrs_to_nary(lcrs_root, depth=0):
     """
-    Recursively converts an LCRS tree node to an N-ary tree node.
+    Converts an LCRS tree to an N-ary tree.
     
     Args:
         lcrs_root: Root node of the LCRS tree (ASTNode)
-        depth: Current depth in the tree (default: 0)
+        depth: Depth assigned to the root of the converted tree (default: 0)
     
     Returns:
         Node: Converted N-ary tree node, or None if input is None
     """
+    warnings.warn(
+        "lcrs_to_nary is deprecated; the parser builds the n-ary tree directly",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if lcrs_root is None:
         return None
 
     # Create new N-ary node with same label and depth
-    nary_node = Node()
-    nary_node.set_data(lcrs_root.label)
-    nary_node.set_depth(depth)
-
-    # Convert LCRS structure to N-ary:
-    # - left pointer becomes first child
-    # - right pointer becomes next sibling (next child of parent)
-    child = lcrs_root.left
-    while child:
-        converted_child = lcrs_to_nary(child, depth + 1)
-        converted_child.set_parent(nary_node)
-        nary_node.children.append(converted_child)
-        child = child.right
-
-    return nary_node
+    nary_root = Node()
+    nary_root.set_data(lcrs_root.label)
+    nary_root.set_depth(depth)
+
+    # Each entry pairs an LCRS node with its already created N-ary counterpart
+    stack = [(lcrs_root, nary_root)]
+    while stack:
+        lcrs_node, nary_node = stack.pop()
+
+        # Convert LCRS structure to N-ary:
+        # - left pointer becomes first child
+        # - right pointer becomes next sibling (next child of parent)
+        child_depth = nary_node.depth + 1
+        child = lcrs_node.left
+        while child:
+            converted_child = Node()
+            converted_child.set_data(child.label)
+            converted_child.set_depth(child_depth)
+            converted_child.set_parent(nary_node)
+            nary_node.children.append(converted_child)
+            stack.append((child, converted_child))
+            child = child.right
 
+    return nary_root
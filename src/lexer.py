@@ -1,43 +1,106 @@
 """
 Lexical analyzer for RPAL language that converts source code into a sequence of tokens.
-Implements token recognition using regular expressions and handles basic lexical elements
-like keywords, identifiers, literals, operators, and punctuation.
+Implements token recognition with a character-dispatch scanner that picks the token class
+from the first character of each lexeme, and handles basic lexical elements like keywords,
+identifiers, literals, operators, and punctuation.
 """
 
 import re
-from enum import Enum
+from array import array
+from enum import IntEnum
 
 
 # === Token Types ===
-class TokenType(Enum):
-    """Enumeration of all possible token types in the RPAL language."""
-    KEYWORD = 'KEYWORD'      # Reserved words like 'let', 'in', 'where', etc.
-    IDENTIFIER = 'IDENTIFIER'  # Variable and function names
-    INTEGER = 'INTEGER'      # Numeric literals
-    STRING = 'STRING'        # String literals enclosed in single quotes
-    OPERATOR = 'OPERATOR'    # Special characters and operators
-    PUNCTUATION = 'PUNCTUATION'  # Delimiters like parentheses and commas
-    EOF = 'EOF'             # End of file marker
+class TokenType(IntEnum):
+    """
+    Enumeration of all possible token types in the RPAL language.
+    Members are integers so token type checks are plain integer comparisons.
+    """
+    KEYWORD = 1      # Reserved words like 'let', 'in', 'where', etc.
+    IDENTIFIER = 2   # Variable and function names
+    INTEGER = 3      # Numeric literals
+    STRING = 4       # String literals enclosed in single quotes
+    OPERATOR = 5     # Special characters and operators
+    PUNCTUATION = 6  # Delimiters like parentheses and commas
+    EOF = 7          # End of file marker
+
+
+# Module-level aliases, cheaper to reach than attributes of the enum class
+KEYWORD = TokenType.KEYWORD
+IDENTIFIER = TokenType.IDENTIFIER
+INTEGER = TokenType.INTEGER
+STRING = TokenType.STRING
+OPERATOR = TokenType.OPERATOR
+PUNCTUATION = TokenType.PUNCTUATION
+EOF = TokenType.EOF
 
 
 # === Token Object ===
 class Token:
     """Represents a lexical token with its type, value, and position in source code."""
+    __slots__ = ('type', 'value', 'line', 'column', '_repr')
     
     def __init__(self, type_, value, line=None, column=None):
-        self.type = type_      # TokenType enum value
+        self.type = type_      # TokenType value
         self.value = value     # Actual token value
         self.line = line       # Line number in source
         self.column = column   # Column position in line
+        self._repr = None      # Cached string representation
 
     def __repr__(self):
-        """String representation of the token with type, value, and position."""
-        if self.type == TokenType.EOF:
-            return f"<{self.type.name} → {self.value!r}>"
-        location = f" @ {self.line}:{self.column}"
-        return f"<{self.type.name}{location} → {self.value!r}>"
+        """String representation of the token with type, value, and position, built once."""
+        if self._repr is None:
+            if self.type == EOF:
+                self._repr = f"<{self.type.name} → {self.value!r}>"
+            else:
+                location = f" @ {self.line}:{self.column}"
+                self._repr = f"<{self.type.name}{location} → {self.value!r}>"
+        return self._repr
+
+# === Token Stream ===
+class TokenStream:
+    """
+    Sequence of tokens stored as parallel arrays of types, values, lines and columns.
+    The parser reads the types and values directly; indexing or iterating the stream
+    builds Token objects on demand, so it can be used like a list of tokens.
+    Types are kept in a list of the shared TokenType members, which the parser
+    indexes faster than an array of type codes; positions are packed in int arrays.
+    """
+    __slots__ = ('types', 'values', 'lines', 'columns')
+
+    def __init__(self):
+        self.types = []             # TokenType members
+        self.values = []            # Token values
+        self.lines = array('i')     # Line numbers in source
+        self.columns = array('i')   # Column positions in line
+
+    def append(self, type_, value, line, column):
+        """Adds a token to the end of the stream."""
+        self.types.append(type_)
+        self.values.append(value)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        """Returns the token at index as a Token, or a list of tokens for a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.values)))]
+        return Token(self.types[index], self.values[index],
+                     self.lines[index], self.columns[index])
+
+    def __iter__(self):
+        for type_, value, line, column in zip(self.types, self.values, self.lines, self.columns):
+            yield Token(type_, value, line, column)
+
+    def __repr__(self):
+        return repr(list(self))
 
 # === Token Patterns ===
+# Reference lexical grammar. The dispatch scanner below implements the same rules and
+# only falls back to the combined pattern for characters outside the ASCII range.
 token_specification = [
     ('WHITESPACE',   r'[ \t]+'),                    # Spaces and tabs
     ('COMMENT',      r'//.*'),                      # Single-line comments
@@ -50,61 +113,183 @@ token_specification = [
     ('PUNCTUATION',  r'[(),;]'),                    # Delimiters
 ]
 
+# All token patterns combined into a single regex, compiled once at import
+_TOK_REGEX = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_specification))
+
+# Reserved words, recognized with a single set lookup once an identifier is scanned
+KEYWORDS = frozenset((
+    'let', 'in', 'where', 'fn', 'rec', 'aug', 'or', 'not', 'gr', 'ge', 'ls', 'le', 'eq', 'ne',
+    'true', 'false', 'nil', 'dummy', 'within', 'and', 'isstring', 'isint', 'istuple',
+    'isfunction', 'isdummy', 'istruthvalue', 'order', 'null',
+))
+
+# Patterns for the rest of a lexeme once its class is known from the first character
+_WS_RUN = re.compile(r'[ \t]+')
+_IDENT_RUN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_INT_RUN = re.compile(r'\d+')
+_STRING_RUN = re.compile(r"'([^'\\]|\\[tn\\']|'''')*'")
+_OP_RUN = re.compile(r'[+\-*/<>&.@/:=~|$!#%^_\[\]{}"‘?\';]+')
+_WORD_CHAR = re.compile(r'\w')
+
+# Characters allowed inside an operator (the OPERATOR character class)
+_OPERATOR_CHARS = frozenset('+-*/<>&.@:=~|$!#%^_[]{}"‘?\';')
+
+# Shared value objects for common operators so equal operators are the same string
+_OPERATOR_VALUES = {op: op for op in (
+    '+', '-', '*', '/', '**', '<', '>', '<=', '>=', '&', '.', '@', '=', '->', '|', ';',
+)}
+
+
+# === Scanners ===
+# Each scanner receives the lexer, the source and the start position of a lexeme,
+# appends the recognized token (if any) and returns the position after the lexeme.
+# Runs of spaces and tabs, the most frequent lexemes, are skipped by the tokenize loop.
+
+def _scan_newline(lexer, source, pos):
+    """Advances the line counter past a line break."""
+    lexer.line += 1
+    lexer._line_start = pos + 1
+    return pos + 1
+
+def _scan_ident_or_kw(lexer, source, pos):
+    """Scans an identifier and classifies it as a keyword when it is reserved."""
+    end = _IDENT_RUN.match(source, pos).end()
+    value = source[pos:end]
+    column = pos - lexer._line_start + 1
+    # Keywords must stand on word boundaries, e.g. '1let' lexes as 1 and an identifier
+    if (value in KEYWORDS
+            and not (pos and _WORD_CHAR.match(source, pos - 1))
+            and not _WORD_CHAR.match(source, end)):
+        lexer._emit(KEYWORD, value, lexer.line, column)
+    else:
+        lexer._emit(IDENTIFIER, value, lexer.line, column)
+    return end
+
+def _scan_int(lexer, source, pos):
+    """Scans an integer literal."""
+    end = _INT_RUN.match(source, pos).end()
+    column = pos - lexer._line_start + 1
+    lexer._emit(INTEGER, int(source[pos:end]), lexer.line, column)
+    return end
+
+def _scan_string(lexer, source, pos):
+    """Scans a string literal; a quote that does not start one is lexed as an operator."""
+    mo = _STRING_RUN.match(source, pos)
+    if mo is None:
+        return _scan_op(lexer, source, pos)
+    value = mo.group()
+    column = pos - lexer._line_start + 1
+    lexer._emit(STRING, value, lexer.line, column)
+    # Line breaks inside a string do not advance the line counter,
+    # but later columns are still measured from them
+    newline = value.rfind('\n')
+    if newline != -1:
+        lexer._line_start = pos + newline + 1
+    return mo.end()
+
+def _scan_op(lexer, source, pos):
+    """Scans a maximal run of operator symbols."""
+    # Single-character and common two-character operators are recognized from the
+    # next characters alone; longer runs such as '||' or '**-' go through the pattern
+    if source[pos + 1:pos + 2] not in _OPERATOR_CHARS:
+        end = pos + 1
+        value = source[pos]
+    elif source[pos + 2:pos + 3] not in _OPERATOR_CHARS and source[pos:pos + 2] in _OPERATOR_VALUES:
+        end = pos + 2
+        value = _OPERATOR_VALUES[source[pos:end]]
+    else:
+        end = _OP_RUN.match(source, pos).end()
+        value = source[pos:end]
+        value = _OPERATOR_VALUES.get(value, value)
+    column = pos - lexer._line_start + 1
+    lexer._emit(OPERATOR, value, lexer.line, column)
+    return end
+
+def _scan_slash(lexer, source, pos):
+    """Skips a '//' comment up to the end of the line, otherwise scans an operator."""
+    if source.startswith('//', pos):
+        end = source.find('\n', pos)
+        return len(source) if end == -1 else end
+    return _scan_op(lexer, source, pos)
+
+def _scan_punct(lexer, source, pos):
+    """Emits a single-character punctuation token."""
+    column = pos - lexer._line_start + 1
+    lexer._emit(PUNCTUATION, source[pos], lexer.line, column)
+    return pos + 1
+
+def _scan_fallback(lexer, source, pos):
+    """Scans a lexeme starting with a non-ASCII character using the combined token pattern."""
+    mo = _TOK_REGEX.match(source, pos)
+    if mo is None:
+        raise SyntaxError(f"Illegal character at line {lexer.line}: {source[pos]!r}")
+
+    # Only Unicode digits and the '‘' operator symbol can start a lexeme here
+    kind = mo.lastgroup
+    value = mo.group()
+    column = pos - lexer._line_start + 1
+    if kind == 'INTEGER':
+        lexer._emit(INTEGER, int(value), lexer.line, column)
+    elif kind == 'OPERATOR':
+        lexer._emit(OPERATOR, value, lexer.line, column)
+    return mo.end()
+
+
+# Scanner for each ASCII code point that may start a lexeme (None marks illegal characters)
+_DISPATCH = [None] * 128
+_DISPATCH[ord('\n')] = _scan_newline
+for _ch in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_':
+    _DISPATCH[ord(_ch)] = _scan_ident_or_kw
+for _ch in '0123456789':
+    _DISPATCH[ord(_ch)] = _scan_int
+for _ch in '+-*<>&.@:=~|$!#%^[]{}"?;':
+    _DISPATCH[ord(_ch)] = _scan_op
+_DISPATCH[ord("'")] = _scan_string
+_DISPATCH[ord('/')] = _scan_slash
+for _ch in '(),':
+    _DISPATCH[ord(_ch)] = _scan_punct
+del _ch
+
 
 # === Lexer Class ===
 class Lexer:
-    """Converts source code into a sequence of tokens using regular expression matching."""
+    """Converts source code into a sequence of tokens by dispatching on the first character of each lexeme."""
     
     def __init__(self, source_code):
         self.source = source_code    # Input source code
-        self.tokens = []             # List of recognized tokens
+        self.tokens = TokenStream()  # Stream of recognized tokens
+        self._emit = self.tokens.append  # Bound append used by the scanners
         self.line = 1                # Current line number
+        self._line_start = 0         # Position where the current line starts
 
     def tokenize(self):
         """
         Tokenizes the source code into a sequence of tokens.
         
         Returns:
-            list[Token]: List of tokens representing the source code
+            TokenStream: Sequence of tokens representing the source code
             
         Raises:
             SyntaxError: If an illegal character is encountered
         """
-        # Compile all token patterns into a single regex
-        tok_regex = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_specification)
-        get_token = re.compile(tok_regex).match
+        # Loop invariants are bound to locals
+        source = self.source
+        length = len(source)
+        dispatch = _DISPATCH
+        skip_ws = _WS_RUN.match
         pos = 0
 
-        while pos < len(self.source):
-            mo = get_token(self.source, pos)
-            if mo is None:
-                raise SyntaxError(f"Illegal character at line {self.line}: {self.source[pos]!r}")
-            
-            # Extract token information
-            kind = mo.lastgroup
-            value = mo.group(kind)
-            column = mo.start() - self.source.rfind('\n', 0, mo.start())
-
-            # Process different token types
-            if kind == 'NEWLINE':
-                self.line += 1
-            elif kind in ('WHITESPACE', 'COMMENT'):
-                pass  # Skip whitespace and comments
-            elif kind == 'KEYWORD':
-                self.tokens.append(Token(TokenType.KEYWORD, value, self.line, column))
-            elif kind == 'IDENTIFIER':
-                self.tokens.append(Token(TokenType.IDENTIFIER, value, self.line, column))
-            elif kind == 'INTEGER':
-                self.tokens.append(Token(TokenType.INTEGER, int(value), self.line, column))
-            elif kind == 'STRING':
-                self.tokens.append(Token(TokenType.STRING, value, self.line, column))
-            elif kind == 'OPERATOR':
-                self.tokens.append(Token(TokenType.OPERATOR, value, self.line, column))
-            elif kind == 'PUNCTUATION':
-                self.tokens.append(Token(TokenType.PUNCTUATION, value, self.line, column))
-
-            pos = mo.end()
+        while pos < length:
+            code = ord(source[pos])
+            if code == 32 or code == 9:
+                # Skip spaces and tabs without a scanner call
+                pos = skip_ws(source, pos).end()
+                continue
+            scan = dispatch[code] if code < 128 else _scan_fallback
+            if scan is None:
+                raise SyntaxError(f"Illegal character at line {self.line}: {source[pos]!r}")
+            pos = scan(self, source, pos)
 
         # Add EOF token at the end
-        self.tokens.append(Token(TokenType.EOF, 'EOF', self.line, pos))
+        self.tokens.append(EOF, 'EOF', self.line, pos)
         return self.tokens
@@ -2,14 +2,19 @@
 Converts an N-ary tree structure to a Left-Child Right-Sibling (LCRS) tree structure.
 N-ary representation uses a list of children for each node, while LCRS uses
 left pointer for first child and right pointer for next sibling.
+
+Deprecated: the interpreter standardizes and executes the n-ary tree directly,
+so no stage of myrpal.py converts back to LCRS. Kept for external callers only.
 """
 
+import warnings
+
 from src.rpal_ast import ASTNode
 from src.standerizer.node import Node  # n-ary Node class
 
 def nary_to_lcrs(nary_node):
     """
-    Recursively converts an N-ary tree node to an LCRS tree node.
+    Converts an N-ary tree to an LCRS tree.
     
     Args:
         nary_node: Root node of the N-ary tree (Node)
@@ -22,21 +27,32 @@ def nary_to_lcrs(nary_node):
         - First child becomes left pointer
         - Remaining children become right siblings of the first child
     """
+    warnings.warn(
+        "nary_to_lcrs is deprecated; the interpreter works on the n-ary tree directly",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if nary_node is None:
         return None
 
     # Create LCRS node with same data as N-ary node
-    lcrs_node = ASTNode(nary_node.data)
+    lcrs_root = ASTNode(nary_node.data)
 
-    # Convert children if they exist
-    if nary_node.children:
-        # First child becomes the left child in LCRS
-        lcrs_node.left = nary_to_lcrs(nary_node.children[0])
+    # Each entry pairs an N-ary node with its already created LCRS counterpart
+    stack = [(nary_node, lcrs_root)]
+    while stack:
+        nary_node, lcrs_node = stack.pop()
 
-        # Convert remaining children to right siblings
-        current = lcrs_node.left
-        for child in nary_node.children[1:]:
-            current.right = nary_to_lcrs(child)
-            current = current.right
+        # First child becomes the left child in LCRS,
+        # remaining children become its right siblings
+        previous = None
+        for child in nary_node.children:
+            converted_child = ASTNode(child.data)
+            if previous is None:
+                lcrs_node.left = converted_child
+            else:
+                previous.right = converted_child
+            previous = converted_child
+            stack.append((child, converted_child))
 
-    return lcrs_node
+    return lcrs_root
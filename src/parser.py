@@ -4,31 +4,85 @@ to build an Abstract Syntax Tree (AST). The parser processes tokens according to
 the RPAL grammar and constructs a tree representation of the program structure.
 """
 
-from src.rpal_ast import ASTNode, build_tree
-from src.lexer import Token, TokenType  
+import sys
+
+from src.rpal_ast import build_tree
+from src.standerizer.node import Node
+from src.lexer import (
+    Token, TokenType, TokenStream, KEYWORD, IDENTIFIER, INTEGER, STRING, OPERATOR, PUNCTUATION,
+)
+
+# === Grammar terminal sets ===
+# Built once at import instead of on every call of the parse functions
+_ADD_OPS = frozenset(('+', '-'))
+_MUL_OPS = frozenset(('*', '/'))
+_VB_STARTERS = frozenset((IDENTIFIER, PUNCTUATION))
+_RN_TOKEN_TYPES = frozenset((IDENTIFIER, INTEGER, STRING))
+_RN_KEYWORDS = frozenset(('true', 'false', 'nil', 'dummy'))
+
+# Leaf label kind of each literal token type, indexed by the integer token type;
+# None for the types that do not form a leaf on their own
+_LEAF_KINDS = [None] * (max(TokenType) + 1)
+_LEAF_KINDS[IDENTIFIER] = 'ID'
+_LEAF_KINDS[INTEGER] = 'INT'
+_LEAF_KINDS[STRING] = 'STR'
+
+# Map relational operators to AST labels
+_RELOPS = {
+    'gr': 'gr', '>': 'gr',
+    'ge': 'ge', '>=': 'ge',
+    'ls': 'ls', '<': 'ls',
+    'le': 'le', '<=': 'le',
+    'eq': 'eq',
+    'ne': 'ne'
+}
+
+def _mk_label(kind, value, _intern=sys.intern):
+    """Builds a leaf label such as '<ID:x>', interned so equal labels share one string."""
+    return _intern(f"<{kind}:{value}>")
 
 class Parser:
     """Implements a recursive descent parser for RPAL language."""
-    
+
     def __init__(self, tokens):
-        self.tokens = tokens      # List of tokens to parse
+        self.tokens = tokens      # Token stream (or list of tokens) to parse
         self.pos = 0             # Current position in token stream
         self.stack = []          # Stack for building AST nodes
 
-    def peek(self):
-        """Look at the current token without consuming it."""
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return None
+        # Token types and values as parallel sequences; the grammar functions
+        # read these instead of building Token objects from the stream
+        if isinstance(tokens, TokenStream):
+            self.types = tokens.types
+            self.values = tokens.values
+        else:
+            self.types = [token.type for token in tokens]
+            self.values = [token.value for token in tokens]
+
+        # Per-position flags for the tokens that can start an Rn or a Vb,
+        # computed once so the application and binding loops only index them
+        starts_rn = bytearray(len(tokens))
+        starts_vb = bytearray(len(tokens))
+        for i, (token_type, value) in enumerate(zip(self.types, self.values)):
+            if token_type == IDENTIFIER:
+                starts_rn[i] = starts_vb[i] = 1
+            elif token_type == PUNCTUATION:
+                if value == '(':
+                    starts_rn[i] = starts_vb[i] = 1
+            elif token_type in _RN_TOKEN_TYPES:
+                starts_rn[i] = 1
+            elif token_type == KEYWORD and value in _RN_KEYWORDS:
+                starts_rn[i] = 1
+        self.starts_rn = starts_rn
+        self.starts_vb = starts_vb
 
     def match(self, expected_type, expected_value=None):
         """
         Match and consume the current token if it matches expected type and value.
         Raises SyntaxError if token doesn't match or end of input is reached.
         """
-        token = self.peek()
-        if token is None:
+        if self.pos >= len(self.tokens):
             raise SyntaxError("Unexpected end of input")
+        token = self.tokens[self.pos]
 
         if token.type == expected_type and (expected_value is None or token.value == expected_value):
             self.pos += 1
@@ -40,34 +94,51 @@ class Parser:
             raise SyntaxError(
                 f"Unexpected token {token.value!r} at line {token.line}, column {token.column}. Expected {expected}."
             )
-        
+
+    def expect(self, expected_type, expected_value=None):
+        """
+        Consume the current token like match, but return only its value.
+        A token is built only when the match fails, for the error raised by match.
+        """
+        pos = self.pos
+        if pos < len(self.values) and self.types[pos] == expected_type:
+            value = self.values[pos]
+            if expected_value is None or value == expected_value:
+                self.pos = pos + 1
+                return value
+        self.match(expected_type, expected_value)
+
     def parse_E(self):
         """
         Parse an expression (E) according to grammar rules:
         E -> let D in E | fn Vb+ . E | Ew
         """
-        token = self.peek()
+        types = self.types
+        values = self.values
+        pos = self.pos
 
-        if token.type == TokenType.KEYWORD and token.value == 'let':
+        if types[pos] == KEYWORD and values[pos] == 'let':
             # Handle let expression: let D in E
-            self.match(TokenType.KEYWORD, 'let')
+            self.pos += 1
             self.parse_D()
-            self.match(TokenType.KEYWORD, 'in')
+            self.expect(KEYWORD, 'in')
             self.parse_E()
             build_tree('let', 2, self.stack)
 
-        elif token.type == TokenType.KEYWORD and token.value == 'fn':
+        elif types[pos] == KEYWORD and values[pos] == 'fn':
             # Handle function definition: fn Vb+ . E
-            self.match(TokenType.KEYWORD, 'fn')
+            self.pos += 1
 
             count = 0
-            while self.peek().type in {TokenType.IDENTIFIER, TokenType.PUNCTUATION}:
-                if self.peek().value == '(' or self.peek().value == ')':
+            pos = self.pos
+            while types[pos] in _VB_STARTERS:
+                if values[pos] == '(' or values[pos] == ')':
                     break
                 self.parse_Vb()
                 count += 1
+                pos = self.pos
 
-            self.match(TokenType.OPERATOR, '.')
+            self.expect(OPERATOR, '.')
             self.parse_E()
             build_tree('lambda', count + 1, self.stack)
 
@@ -80,8 +151,9 @@ class Parser:
         """
         self.parse_T()
 
-        if self.peek().type == TokenType.KEYWORD and self.peek().value == 'where':
-            self.match(TokenType.KEYWORD, 'where')
+        pos = self.pos
+        if self.types[pos] == KEYWORD and self.values[pos] == 'where':
+            self.pos += 1
             self.parse_Dr()
             build_tree('where', 2, self.stack)
 
@@ -89,13 +161,17 @@ class Parser:
         """
         Parse tuple expression: T -> Ta (, Ta)*
         """
+        types = self.types
+        values = self.values
         self.parse_Ta()
         count = 1
 
-        while self.peek().type == TokenType.PUNCTUATION and self.peek().value == ',':
-            self.match(TokenType.PUNCTUATION, ',')
+        pos = self.pos
+        while types[pos] == PUNCTUATION and values[pos] == ',':
+            self.pos += 1
             self.parse_Ta()
             count += 1
+            pos = self.pos
 
         if count > 1:
             build_tree('tau', count, self.stack)
@@ -104,12 +180,16 @@ class Parser:
         """
         Parse augmented tuple: Ta -> Tc (aug Tc)*
         """
+        types = self.types
+        values = self.values
         self.parse_Tc()
 
-        while self.peek().type == TokenType.KEYWORD and self.peek().value == 'aug':
-            self.match(TokenType.KEYWORD, 'aug')
+        pos = self.pos
+        while types[pos] == KEYWORD and values[pos] == 'aug':
+            self.pos += 1
             self.parse_Tc()
             build_tree('aug', 2, self.stack)
+            pos = self.pos
 
     def parse_Tc(self):
         """
@@ -117,10 +197,11 @@ class Parser:
         """
         self.parse_B()
 
-        if self.peek().type == TokenType.OPERATOR and self.peek().value == '->':
-            self.match(TokenType.OPERATOR, '->')
+        pos = self.pos
+        if self.types[pos] == OPERATOR and self.values[pos] == '->':
+            self.pos += 1
             self.parse_Tc()
-            self.match(TokenType.OPERATOR, '|')
+            self.expect(OPERATOR, '|')
             self.parse_Tc()
             build_tree('->', 3, self.stack)
 
@@ -128,30 +209,39 @@ class Parser:
         """
         Parse boolean expression: B -> Bt (or Bt)*
         """
+        types = self.types
+        values = self.values
         self.parse_Bt()
 
-        while self.peek().type == TokenType.KEYWORD and self.peek().value == 'or':
-            self.match(TokenType.KEYWORD, 'or')
+        pos = self.pos
+        while types[pos] == KEYWORD and values[pos] == 'or':
+            self.pos += 1
             self.parse_Bt()
             build_tree('or', 2, self.stack)
+            pos = self.pos
 
     def parse_Bt(self):
         """
         Parse boolean term: Bt -> Bs (& Bs)*
         """
+        types = self.types
+        values = self.values
         self.parse_Bs()
 
-        while self.peek().type == TokenType.OPERATOR and self.peek().value == '&':
-            self.match(TokenType.OPERATOR, '&')
+        pos = self.pos
+        while types[pos] == OPERATOR and values[pos] == '&':
+            self.pos += 1
             self.parse_Bs()
             build_tree('&', 2, self.stack)
+            pos = self.pos
 
     def parse_Bs(self):
         """
         Parse boolean secondary: Bs -> not Bp | Bp
         """
-        if self.peek().type == TokenType.KEYWORD and self.peek().value == 'not':
-            self.match(TokenType.KEYWORD, 'not')
+        pos = self.pos
+        if self.types[pos] == KEYWORD and self.values[pos] == 'not':
+            self.pos += 1
             self.parse_Bp()
             build_tree('not', 1, self.stack)
         else:
@@ -163,34 +253,24 @@ class Parser:
         """
         self.parse_A()
 
-        token = self.peek()
-        if token is None:
-            return
-
-        # Map relational operators to AST labels
-        relational_ops = {
-            'gr': 'gr', '>': 'gr',
-            'ge': 'ge', '>=': 'ge',
-            'ls': 'ls', '<': 'ls',
-            'le': 'le', '<=': 'le',
-            'eq': 'eq',
-            'ne': 'ne'
-        }
-
-        if token.value in relational_ops:
-            op_token = self.match(token.type, token.value)
+        value = self.values[self.pos]
+        if value in _RELOPS:
+            self.pos += 1
             self.parse_A()
-            build_tree(relational_ops[op_token.value], 2, self.stack)
+            build_tree(_RELOPS[value], 2, self.stack)
 
     def parse_A(self):
         """
         Parse arithmetic expression: A -> [+-]? At ((+|-) At)*
         """
-        token = self.peek()
+        types = self.types
+        values = self.values
+        pos = self.pos
 
         # Handle unary operators
-        if token.type == TokenType.OPERATOR and token.value in {'+', '-'}:
-            op = self.match(TokenType.OPERATOR).value
+        if types[pos] == OPERATOR and values[pos] in _ADD_OPS:
+            op = values[pos]
+            self.pos += 1
             self.parse_At()
             if op == '-':
                 build_tree('neg', 1, self.stack)
@@ -198,21 +278,29 @@ class Parser:
             self.parse_At()
 
             # Handle binary operators
-            while self.peek().type == TokenType.OPERATOR and self.peek().value in {'+', '-'}:
-                op = self.match(TokenType.OPERATOR).value
+            pos = self.pos
+            while types[pos] == OPERATOR and values[pos] in _ADD_OPS:
+                op = values[pos]
+                self.pos += 1
                 self.parse_At()
                 build_tree(op, 2, self.stack)
+                pos = self.pos
 
     def parse_At(self):
         """
         Parse arithmetic term: At -> Af ((*|/) Af)*
         """
+        types = self.types
+        values = self.values
         self.parse_Af()
 
-        while self.peek().type == TokenType.OPERATOR and self.peek().value in {'*', '/'}:
-            op = self.match(TokenType.OPERATOR).value
+        pos = self.pos
+        while types[pos] == OPERATOR and values[pos] in _MUL_OPS:
+            op = values[pos]
+            self.pos += 1
             self.parse_Af()
             build_tree(op, 2, self.stack)
+            pos = self.pos
 
     def parse_Af(self):
         """
@@ -220,8 +308,9 @@ class Parser:
         """
         self.parse_Ap()
 
-        if self.peek().type == TokenType.OPERATOR and self.peek().value == '**':
-            self.match(TokenType.OPERATOR, '**')
+        pos = self.pos
+        if self.types[pos] == OPERATOR and self.values[pos] == '**':
+            self.pos += 1
             self.parse_Af()
             build_tree('**', 2, self.stack)
 
@@ -229,72 +318,58 @@ class Parser:
         """
         Parse arithmetic primary: Ap -> R (@ <id> R)*
         """
+        types = self.types
+        values = self.values
         self.parse_R()
 
-        while self.peek().type == TokenType.OPERATOR and self.peek().value == '@':
-            self.match(TokenType.OPERATOR, '@')
-            id_token = self.match(TokenType.IDENTIFIER)
-            self.stack.append(ASTNode(f"<ID:{id_token.value}>"))
+        pos = self.pos
+        while types[pos] == OPERATOR and values[pos] == '@':
+            self.pos += 1
+            name = self.expect(IDENTIFIER)
+            self.stack.append(Node(_mk_label('ID', name)))
             self.parse_R()
             build_tree('@', 3, self.stack)
-    
+            pos = self.pos
+
     def parse_R(self):
         """
         Parse R-expression: R -> Rn+
         """
+        starts_rn = self.starts_rn
         self.parse_Rn()
 
-        while self.is_start_of_Rn():
+        while starts_rn[self.pos]:
             self.parse_Rn()
             build_tree('gamma', 2, self.stack)
 
-    def is_start_of_Rn(self):
-        """Check if current token can start an Rn expression."""
-        token = self.peek()
-        if token is None:
-            return False
-
-        return (
-            token.type in {TokenType.IDENTIFIER, TokenType.INTEGER, TokenType.STRING} or
-            (token.type == TokenType.KEYWORD and token.value in {'true', 'false', 'nil', 'dummy'}) or
-            (token.type == TokenType.PUNCTUATION and token.value == '(')
-        )
-
     def parse_Rn(self):
         """
         Parse Rn-expression: Rn -> (E) | <id> | <integer> | <string> | true | false | nil | dummy
         """
-        token = self.peek()
+        pos = self.pos
+        token_type = self.types[pos]
+        value = self.values[pos]
+
+        kind = _LEAF_KINDS[token_type]
+        if kind is not None:
+            # Handle identifier, integer and string literals
+            self.pos += 1
+            self.stack.append(Node(_mk_label(kind, value)))
 
-        if token.type == TokenType.PUNCTUATION and token.value == '(':
+        elif token_type == PUNCTUATION and value == '(':
             # Handle parenthesized expression
-            self.match(TokenType.PUNCTUATION, '(')
+            self.pos += 1
             self.parse_E()
-            self.match(TokenType.PUNCTUATION, ')')
-
-        elif token.type == TokenType.IDENTIFIER:
-            # Handle identifier
-            token = self.match(TokenType.IDENTIFIER)
-            self.stack.append(ASTNode(f"<ID:{token.value}>"))
-
-        elif token.type == TokenType.INTEGER:
-            # Handle integer literal
-            token = self.match(TokenType.INTEGER)
-            self.stack.append(ASTNode(f"<INT:{token.value}>"))
-
-        elif token.type == TokenType.STRING:
-            # Handle string literal
-            token = self.match(TokenType.STRING)
-            self.stack.append(ASTNode(f"<STR:{token.value}>"))
+            self.expect(PUNCTUATION, ')')
 
-        elif token.type == TokenType.KEYWORD and token.value in {'true', 'false', 'nil', 'dummy'}:
+        elif token_type == KEYWORD and value in _RN_KEYWORDS:
             # Handle boolean and special literals
-            token = self.match(TokenType.KEYWORD)
-            label = f"<{token.value}>" if token.value == "nil" else token.value
-            self.stack.append(ASTNode(label))
+            self.pos += 1
+            label = f"<{value}>" if value == "nil" else value
+            self.stack.append(Node(label))
 
         else:
-            raise SyntaxError(f"Unexpected token in Rn: {token}")
+            raise SyntaxError(f"Unexpected token in Rn: {self.tokens[pos]}")
 
     def parse_D(self):
         """
@@ -302,8 +377,9 @@ class Parser:
         """
         self.parse_Da()
 
-        if self.peek().type == TokenType.KEYWORD and self.peek().value == 'within':
-            self.match(TokenType.KEYWORD, 'within')
+        pos = self.pos
+        if self.types[pos] == KEYWORD and self.values[pos] == 'within':
+            self.pos += 1
             self.parse_D()
             build_tree('within', 2, self.stack)
 
@@ -311,13 +387,17 @@ class Parser:
         """
         Parse and definition: Da -> Dr (and Dr)*
         """
+        types = self.types
+        values = self.values
         self.parse_Dr()
         count = 1
 
-        while self.peek().type == TokenType.KEYWORD and self.peek().value == 'and':
-            self.match(TokenType.KEYWORD, 'and')
+        pos = self.pos
+        while types[pos] == KEYWORD and values[pos] == 'and':
+            self.pos += 1
             self.parse_Dr()
             count += 1
+            pos = self.pos
 
         if count > 1:
             build_tree('and', count, self.stack)
@@ -326,8 +406,9 @@ class Parser:
         """
         Parse recursive definition: Dr -> rec Db | Db
         """
-        if self.peek().type == TokenType.KEYWORD and self.peek().value == 'rec':
-            self.match(TokenType.KEYWORD, 'rec')
+        pos = self.pos
+        if self.types[pos] == KEYWORD and self.values[pos] == 'rec':
+            self.pos += 1
             self.parse_Db()
             build_tree('rec', 1, self.stack)
         else:
@@ -337,86 +418,84 @@ class Parser:
         """
         Parse basic definition: Db -> (D) | Vl = E | <id> Vb+ = E
         """
-        if self.peek().type == TokenType.PUNCTUATION and self.peek().value == '(':
+        pos = self.pos
+        token_type = self.types[pos]
+        if token_type == PUNCTUATION and self.values[pos] == '(':
             # Handle parenthesized definition
-            self.match(TokenType.PUNCTUATION, '(')
+            self.pos += 1
             self.parse_D()
-            self.match(TokenType.PUNCTUATION, ')')
+            self.expect(PUNCTUATION, ')')
 
         elif (
-            self.peek().type == TokenType.IDENTIFIER and
+            token_type == IDENTIFIER and
             self.lookahead_is_vb_sequence()
         ):
             # Handle function definition
-            id_token = self.match(TokenType.IDENTIFIER)
-            self.stack.append(ASTNode(f"<ID:{id_token.value}>"))
+            self.pos += 1
+            self.stack.append(Node(_mk_label('ID', self.values[pos])))
 
             count = 1
-            while self.is_start_of_Vb():
+            starts_vb = self.starts_vb
+            while starts_vb[self.pos]:
                 self.parse_Vb()
                 count += 1
 
-            self.match(TokenType.OPERATOR, '=')
+            self.expect(OPERATOR, '=')
             self.parse_E()
             build_tree('function_form', count + 1, self.stack)
 
         else:
             # Handle simple definition
             self.parse_Vl()
-            self.match(TokenType.OPERATOR, '=')
+            self.expect(OPERATOR, '=')
             self.parse_E()
             build_tree('=', 2, self.stack)
 
-    def is_start_of_Vb(self):
-        """Check if current token can start a Vb (variable binding)."""
-        token = self.peek()
-        return (
-            token.type == TokenType.IDENTIFIER or
-            (token.type == TokenType.PUNCTUATION and token.value == '(')
-        )
-
     def lookahead_is_vb_sequence(self):
         """Check if next token is part of a variable binding sequence."""
         if self.pos + 1 >= len(self.tokens):
             return False
-
-        next_token = self.tokens[self.pos + 1]
-        return (
-            next_token.type == TokenType.IDENTIFIER or
-            (next_token.type == TokenType.PUNCTUATION and next_token.value == '(')
-        )
+        return bool(self.starts_vb[self.pos + 1])
 
     def parse_Vb(self):
         """
         Parse variable binding: Vb -> <id> | (<Vl>)
         """
-        if self.peek().type == TokenType.PUNCTUATION and self.peek().value == '(':
-            self.match(TokenType.PUNCTUATION, '(')
+        types = self.types
+        values = self.values
+        pos = self.pos
+        if types[pos] == PUNCTUATION and values[pos] == '(':
+            self.pos += 1
 
-            if self.peek().type == TokenType.PUNCTUATION and self.peek().value == ')':
-                self.match(TokenType.PUNCTUATION, ')')
-                self.stack.append(ASTNode('()'))  # Empty binding
+            pos = self.pos
+            if types[pos] == PUNCTUATION and values[pos] == ')':
+                self.pos += 1
+                self.stack.append(Node('()'))  # Empty binding
             else:
                 self.parse_Vl()
-                self.match(TokenType.PUNCTUATION, ')')
+                self.expect(PUNCTUATION, ')')
 
         else:
-            id_token = self.match(TokenType.IDENTIFIER)
-            self.stack.append(ASTNode(f"<ID:{id_token.value}>"))
+            name = self.expect(IDENTIFIER)
+            self.stack.append(Node(_mk_label('ID', name)))
 
     def parse_Vl(self):
         """
         Parse variable list: Vl -> <id> (, <id>)*
         """
-        id_token = self.match(TokenType.IDENTIFIER)
-        self.stack.append(ASTNode(f"<ID:{id_token.value}>"))
+        types = self.types
+        values = self.values
+        name = self.expect(IDENTIFIER)
+        self.stack.append(Node(_mk_label('ID', name)))
         count = 1
 
-        while self.peek().type == TokenType.PUNCTUATION and self.peek().value == ',':
-            self.match(TokenType.PUNCTUATION, ',')
-            id_token = self.match(TokenType.IDENTIFIER)
-            self.stack.append(ASTNode(f"<ID:{id_token.value}>"))
+        pos = self.pos
+        while types[pos] == PUNCTUATION and values[pos] == ',':
+            self.pos += 1
+            name = self.expect(IDENTIFIER)
+            self.stack.append(Node(_mk_label('ID', name)))
             count += 1
+            pos = self.pos
 
         if count > 1:
             build_tree(',', count, self.stack)
@@ -426,7 +505,7 @@ class Parser:
         Parse the entire token stream into an AST.
         
         Returns:
-            ASTNode: Root of the constructed abstract syntax tree
+            Node: Root of the constructed abstract syntax tree
             
         Raises:
             SyntaxError: If the input doesn't match the grammar
@@ -434,4 +513,14 @@ class Parser:
         self.parse_E()
         if self.pos < len(self.tokens) - 1:
             raise SyntaxError("Unexpected tokens after end of expression")
-        return self.stack.pop()
+        root = self.stack.pop()
+
+        # Assign node depths in one pass now that the tree is complete
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            child_depth = node.depth + 1
+            for child in node.children:
+                child.depth = child_depth
+                stack.append(child)
+        return root
@@ -1,14 +1,20 @@
 """
-Implementation of Abstract Syntax Tree (AST) nodes using Left-Child Right-Sibling (LCRS) representation.
-This representation uses two pointers per node: left for first child and right for next sibling,
-which allows efficient tree traversal and manipulation.
+Abstract Syntax Tree construction for the parser.
+build_tree assembles the n-ary Node trees that the parser, the standardizer and the
+CSE machine work on. ASTNode is the older Left-Child Right-Sibling (LCRS) node, with
+a left pointer to the first child and a right pointer to the next sibling; it is only
+used by the deprecated tree converters and the LCRS helpers in src/utils.py.
 """
 
+from src.standerizer.node import Node
+
 class ASTNode:
     """
     Represents a node in the Abstract Syntax Tree using LCRS representation.
     Each node has a label and two pointers: left for first child and right for next sibling.
     """
+    __slots__ = ('label', 'left', 'right')
+
     def __init__(self, label):
         self.label = label       # Node label (e.g., '+', 'assign', '<ID:x>')
         self.left = None         # Pointer to first child
@@ -16,37 +22,21 @@ class ASTNode:
 
 def build_tree(label, n, stack):
     """
-    Builds a tree node with n children from the stack.
-    The children are popped from the stack in reverse order and connected as siblings.
+    Builds an n-ary tree node with n children from the stack.
+    The top n nodes of the stack are removed in one slice and become the children
+    of the new node in their original order.
     
     Args:
         label: Label for the new tree node
         n: Number of children to attach
         stack: Stack containing the child nodes
     """
-    p = None
-    # Pop n children and connect them as siblings
-    for _ in range(n):
-        c = stack.pop()
-        c.right = p
-        p = c
-    
-    # Create new node and attach children
-    node = ASTNode(label)
-    node.left = p
+    node = Node(label)
+    if n:
+        # Take the n topmost nodes as the children of the new node
+        children = stack[-n:]
+        del stack[-n:]
+        for child in children:
+            child.parent = node
+        node.children = children
     stack.append(node)
-
-def print_ast(node, indent=0):
-    """
-    Prints the AST in a tree-like structure using indentation.
-    Traverses the tree in pre-order, printing each node with appropriate indentation.
-    
-    Args:
-        node: Root node of the tree to print
-        indent: Current indentation level (default: 0)
-    """
-    while node:
-        print("." * indent + node.label)
-        if node.left:
-            print_ast(node.left, indent + 1)
-        node = node.right
@@ -1,3 +1,26 @@
+import sys
+
+# Indentation prefixes for the usual tree depths
+_DOTS = ["." * i for i in range(64)]
+
+
+def walk(root, depth=0):
+    """
+    Yields (node, depth) for every node of the tree in pre-order.
+    Used by pre_order_traverse, so printing a deeply nested tree does not recurse.
+    Args:
+        root: Root node of the tree to walk
+        depth: Depth reported for the root (default: 0)
+    """
+    stack = [(root, depth)]
+    while stack:
+        node, depth = stack.pop()
+        yield node, depth
+        # Push children reversed so the leftmost child is visited first
+        child_depth = depth + 1
+        stack.extend((child, child_depth) for child in reversed(node.children))
+
+
 class AST:
     """Abstract Syntax Tree class that represents the hierarchical structure of parsed code."""
     
@@ -20,14 +43,19 @@ class AST:
 
     def pre_order_traverse(self, node, i):
         """
-        Perform pre-order traversal of the AST.
+        Perform pre-order traversal of the AST, printing every node of the subtree.
+        Walks the tree with walk() and writes the whole listing to stdout at once.
         Args:
             node: Current node to process
             i: Current indentation level
         """
-        print("." * i + str(node.get_data()))
-        for child in node.children:
-            self.pre_order_traverse(child, i + 1)
+        lines = []
+        for node, i in walk(node, i):
+            dots = _DOTS[i] if i < len(_DOTS) else "." * i
+            lines.append(dots + str(node.get_data()))
+
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
     def print_ast(self):
         """Print the AST structure using pre-order traversal with indentation."""
@@ -18,32 +18,23 @@ class ASTFactory:
             AST object with properly structured nodes
         """
         root = NodeFactory.get_node(data[0], 0)  # Create root node
-        previous_node = root
-        current_depth = 0
+
+        # stack[k] is the most recent node at depth k, i.e. the path from the root
+        # to the previous node, so a node's parent is found without walking up the tree
+        stack = [root]
 
         for s in data[1:]:
             # Calculate node depth by counting leading dots
-            i = 0
-            d = 0
-            while s[i] == '.':
-                d += 1
-                i += 1
-
-            current_node = NodeFactory.get_node(s[i:], d)
-
-            # Handle node relationships based on depth
-            if current_depth < d:
-                # Add as child if deeper than previous node
-                previous_node.children.append(current_node)
-                current_node.set_parent(previous_node)  
-            else:
-                # Find appropriate parent at same depth
-                while previous_node.get_depth() != d:
-                    previous_node = previous_node.get_parent()
-                previous_node.get_parent().children.append(current_node)  
-                current_node.set_parent(previous_node.get_parent())  
-
-            previous_node = current_node
-            current_depth = d
+            label = s.lstrip('.')
+            d = len(s) - len(label)
+
+            current_node = NodeFactory.get_node(label, d)
+
+            # Drop nodes at the same or deeper level; the top is then the parent
+            del stack[d:]
+            parent = stack[-1]
+            parent.children.append(current_node)
+            current_node.set_parent(parent)
+            stack.append(current_node)
 
         return AST(root)  
@@ -1,8 +1,9 @@
 class Node:
     """Represents a node in the Abstract Syntax Tree with data, depth, parent-child relationships, and standardization status."""
+    __slots__ = ('data', 'depth', 'parent', 'children', 'is_standardized')
     
-    def __init__(self):
-        self.data = None
+    def __init__(self, data=None):
+        self.data = data
         self.depth = 0
         self.parent = None
         self.children = []
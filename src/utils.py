@@ -4,6 +4,10 @@ These functions provide convenient ways to work with the LCRS tree structure by
 list-based children access and the LCRS pointer-based representation.
 """
 
+# Opcodes of the flattened tree produced by flatten_ast
+ENTER = 0   # Start of a node, emitted before its children
+EXIT = 1    # End of a node, emitted after its children
+
 def get_children(node):
     """
     Converts the LCRS representation of children into a list.
@@ -16,12 +20,54 @@ def get_children(node):
         list: List of child nodes in order from left to right
     """
     children = []
+    append = children.append  # Bound once instead of looked up per child
     child = node.left
-    while child:
-        children.append(child)
+    while child is not None:
+        append(child)
         child = child.right
     return children
 
+def iter_children(node):
+    """
+    Yields the children of a node in order from left to right.
+    Follows the right-sibling chain lazily, for callers that only need to
+    visit the children once and do not need a list.
+    
+    Args:
+        node: AST node whose children to visit
+        
+    Yields:
+        Child nodes in order from left to right
+    """
+    child = node.left
+    while child is not None:
+        yield child
+        child = child.right
+
+def get_children_tuple(node):
+    """
+    Returns the children of a node as a tuple, for callers that only read them.
+    Unlike the list from get_children, the result cannot be modified by accident
+    and can be hashed, e.g. to serve as a cache key.
+    
+    Args:
+        node: AST node whose children to retrieve
+        
+    Returns:
+        tuple: Child nodes in order from left to right
+    """
+    first = node.left
+    if first is None:
+        return ()
+
+    # Unary and binary productions are the most common, so build them directly
+    second = first.right
+    if second is None:
+        return (first,)
+    if second.right is None:
+        return (first, second)
+    return tuple(iter_children(node))
+
 def set_children(node, children):
     """
     Sets the children of a node using LCRS representation.
@@ -31,14 +77,58 @@ def set_children(node, children):
         node: Parent node to set children for
         children: List of child nodes to attach (can be empty)
     """
-    if not children:
+    n = len(children)
+    if not n:
         node.left = None
         return
-        
+
+    # Unary and binary productions are the most common, so link them directly
+    if n == 1:
+        first = children[0]
+        node.left = first
+        first.right = None
+        return
+    if n == 2:
+        first, second = children
+        node.left = first
+        first.right = second
+        second.right = None
+        return
+
     # Set first child as left pointer
-    node.left = children[0]
+    previous = children[0]
+    node.left = previous
     
-    # Connect remaining children as right siblings
-    for i in range(len(children) - 1):
-        children[i].right = children[i + 1]
-    children[-1].right = None
+    # Connect remaining children as right siblings, trailing the previous one
+    for child in children[1:]:
+        previous.right = child
+        previous = child
+    previous.right = None
+
+def flatten_ast(root):
+    """
+    Flattens an LCRS tree into a list of (opcode, node) pairs.
+    Each node contributes an ENTER entry before the entries of its children and
+    an EXIT entry after them, so siblings follow each other in the list and a
+    walk over it needs no recursion. The list must be rebuilt if the tree changes.
+    
+    Args:
+        root: Root node of the LCRS tree
+        
+    Returns:
+        list: (opcode, node) pairs in traversal order, empty if root is None
+    """
+    flat = []
+    if root is None:
+        return flat
+
+    stack = [(ENTER, root)]
+    while stack:
+        op, node = stack.pop()
+        flat.append((op, node))
+        if op == ENTER:
+            # Close the node after its children, which are pushed reversed
+            # so the leftmost child is entered first
+            stack.append((EXIT, node))
+            stack.extend((ENTER, child) for child in reversed(get_children_tuple(node)))
+    return flat
@@ -4,55 +4,197 @@ Runs test programs through both interpreters and verifies that the outputs match
 """
 
 import os
+import sys
+import argparse
+import hashlib
+import tempfile
 import subprocess
 import difflib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_rpal_exe(file_path):
+# diff-match-patch is optional; it is only used to diff large mismatching outputs
+try:
+    from diff_match_patch import diff_match_patch
+except ImportError:
+    diff_match_patch = None
+
+# Outputs longer than this are diffed with diff-match-patch when it is installed
+LARGE_OUTPUT = 8192
+
+# Number of unchanged lines shown around each change in a diff
+DIFF_CONTEXT = 3
+
+# Directory holding the saved rpal.exe outputs, keyed by test file content
+CACHE_DIR = Path('.rpal-cache')
+
+# Record separator and error marker of the myrpal.py --batch output
+BATCH_SEPARATOR = b"\x1e"
+BATCH_ERROR = b"\x15"
+
+def normalize_output(output):
+    """
+    Normalize raw interpreter output for comparison.
+    myrpal.py writes through Python's text-mode stdout, which ends lines with
+    \r\n on Windows, while the Cygwin rpal.exe always writes \n; line endings
+    are unified before surrounding whitespace is stripped.
+    
+    Args:
+        output: Raw output bytes
+        
+    Returns:
+        bytes: Output with \n line endings and no leading or trailing whitespace
+    """
+    return output.replace(b"\r\n", b"\n").strip()
+
+def list_test_files(test_dir='test-programs'):
+    """
+    List the RPAL test files of a directory, sorted by name.
+    
+    Args:
+        test_dir: Directory holding the test programs
+        
+    Returns:
+        list[str]: Paths of the .rpal files in the directory
+    """
+    with os.scandir(test_dir) as entries:
+        return sorted(entry.path for entry in entries
+                      if entry.name.endswith('.rpal') and entry.is_file())
+
+def run_rpal_exe(file_path, use_cache=True):
     """
     Run a test file using the original RPAL interpreter (rpal.exe).
+    The reference output only depends on the program, so successful outputs are
+    saved in CACHE_DIR under a hash of the file content and reused on later runs.
     
     Args:
         file_path: Path to the RPAL test file
+        use_cache: Reuse a saved output if there is one (default: True); a fresh
+            output is saved either way
         
     Returns:
-        str: Output from the original interpreter or error message
+        bytes: Output from the original interpreter or error message
     """
+    key = hashlib.blake2b(Path(file_path).read_bytes(), digest_size=16).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.out"
+    if use_cache and cache_file.exists():
+        return normalize_output(cache_file.read_bytes())
+
     try:
-        result = subprocess.run(['original-interpreter/rpal.exe', str(file_path)], 
+        result = subprocess.run(['original-interpreter/rpal.exe', file_path], 
                               capture_output=True, 
-                              text=True, 
                               check=True)
-        return result.stdout.strip()
     except subprocess.CalledProcessError as e:
-        return f"Error running rpal.exe: {e.stderr}"
+        return b"Error running rpal.exe: " + e.stderr
+
+    output = normalize_output(result.stdout)
+
+    # Write to a temporary file first so concurrent runs never read a partial entry
+    CACHE_DIR.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, delete=False) as file:
+        file.write(output)
+    os.replace(file.name, cache_file)
+    return output
 
 def run_myrpal(file_path):
     """
     Run a test file using our RPAL interpreter (myrpal.py).
+    The interpreter only needs the standard library, so it is started with -S
+    to skip site initialization and -OO to skip asserts and docstrings.
     
     Args:
         file_path: Path to the RPAL test file
         
     Returns:
-        str: Output from our interpreter or error message
+        bytes: Output from our interpreter or error message
     """
     try:
-        result = subprocess.run(['python', 'myrpal.py', str(file_path)], 
+        result = subprocess.run([sys.executable, '-S', '-OO', 'myrpal.py', file_path], 
                               capture_output=True, 
-                              text=True, 
                               check=True)
-        return result.stdout.strip()
+        return normalize_output(result.stdout)
     except subprocess.CalledProcessError as e:
-        return f"Error running myrpal.py: {e.stderr}"
+        return b"Error running myrpal.py: " + e.stderr
 
-def compare_outputs(original, mine, filename):
+def run_myrpal_batch(file_paths):
     """
-    Compare outputs from both interpreters and generate a diff if they don't match.
+    Run several test files through a single myrpal.py process in batch mode,
+    so the interpreter starts once instead of once per file. Files left without
+    a record because the batch process died are run separately with run_myrpal.
+    
+    Args:
+        file_paths: Paths to the RPAL test files
+        
+    Returns:
+        list[bytes]: Output from our interpreter or error message, for each file in order
+    """
+    paths = "".join(f"{file_path}\n" for file_path in file_paths)
+    result = subprocess.run([sys.executable, '-S', '-OO', 'myrpal.py', '--batch'],
+                            input=paths.encode(),
+                            capture_output=True)
+
+    outputs = []
+    # Whatever follows the last separator is empty, or partial output of a program
+    # the process died on
+    records = result.stdout.split(BATCH_SEPARATOR)[:-1]
+    for record in records[:len(file_paths)]:
+        if record.startswith(BATCH_ERROR):
+            outputs.append(b"Error running myrpal.py: " + record[len(BATCH_ERROR):])
+        else:
+            outputs.append(normalize_output(record))
+
+    # If the batch process itself died, run the files it did not get to one by one
+    for file_path in file_paths[len(outputs):]:
+        outputs.append(run_myrpal(file_path))
+    return outputs
+
+def line_diff(original, mine):
+    """
+    Generate a unified-style line diff of two large outputs with diff-match-patch.
+    Lines are mapped to single characters first, so the diff runs over lines
+    instead of characters, and long unchanged runs are cut to DIFF_CONTEXT lines.
     
     Args:
         original: Output from the original interpreter
         mine: Output from our interpreter
+        
+    Returns:
+        list[str]: Lines of the diff
+    """
+    dmp = diff_match_patch()
+    original_chars, mine_chars, line_array = dmp.diff_linesToChars(original, mine)
+    diffs = dmp.diff_main(original_chars, mine_chars, False)
+    dmp.diff_charsToLines(diffs, line_array)
+
+    diff = ['--- rpal.exe output', '+++ myrpal.py output']
+    for i, (op, text) in enumerate(diffs):
+        lines = text.splitlines()
+        if op == diff_match_patch.DIFF_DELETE:
+            diff.extend('-' + line for line in lines)
+        elif op == diff_match_patch.DIFF_INSERT:
+            diff.extend('+' + line for line in lines)
+        else:
+            # Keep context after the previous change and before the next one
+            head = lines[:DIFF_CONTEXT] if i > 0 else []
+            tail = lines[-DIFF_CONTEXT:] if i < len(diffs) - 1 else []
+            if len(head) + len(tail) >= len(lines):
+                diff.extend(' ' + line for line in lines)
+            else:
+                diff.extend(' ' + line for line in head)
+                diff.append('@@')
+                diff.extend(' ' + line for line in tail)
+    return diff
+
+def compare_outputs(original, mine, filename):
+    """
+    Compare outputs from both interpreters and generate a diff if they don't match.
+    The outputs are compared as raw bytes and only decoded to build a diff.
+    Large outputs are diffed with diff-match-patch when it is installed, since
+    difflib gets slow on long inputs; otherwise difflib is used.
+    
+    Args:
+        original: Output from the original interpreter, as bytes
+        mine: Output from our interpreter, as bytes
         filename: Name of the test file (for reporting)
         
     Returns:
@@ -60,7 +202,13 @@ def compare_outputs(original, mine, filename):
     """
     if original == mine:
         return True, ""
+
+    original = original.decode('utf-8', errors='replace')
+    mine = mine.decode('utf-8', errors='replace')
     
+    if diff_match_patch is not None and max(len(original), len(mine)) > LARGE_OUTPUT:
+        return False, '\n'.join(line_diff(original, mine))
+
     # Generate a unified diff for better readability
     diff = list(difflib.unified_diff(
         original.splitlines(),
@@ -71,14 +219,18 @@ def compare_outputs(original, mine, filename):
     ))
     return False, '\n'.join(diff)
 
-def run_tests():
+def run_tests(use_cache=True):
     """
     Run all test files in the test-programs directory and report results.
     Compares outputs from both interpreters and provides a detailed test summary.
+    rpal.exe runs on every file concurrently in a thread pool while our interpreter
+    runs all files in one batch process; results are reported in file order.
+    
+    Args:
+        use_cache: Reuse saved rpal.exe outputs (default: True)
     """
     # Find all RPAL test files
-    test_dir = Path('test-programs')
-    test_files = sorted(test_dir.glob('*.rpal'))
+    test_files = list_test_files()
     
     total_tests = len(test_files)
     passed_tests = 0
@@ -87,28 +239,35 @@ def run_tests():
     print(f"\nRunning {total_tests} test files...\n")
     print("=" * 80)
     
-    # Run each test file
-    for test_file in test_files:
-        print(f"\nTesting: {test_file.name}")
-        print("-" * 40)
-        
-        # Get outputs from both interpreters
-        rpal_output = run_rpal_exe(test_file)
-        myrpal_output = run_myrpal(test_file)
-        
-        # Compare and report results
-        passed, diff = compare_outputs(rpal_output, myrpal_output, test_file.name)
-        
-        if passed:
-            print("✅ PASSED")
-            passed_tests += 1
-        else:
-            print("❌ FAILED")
-            print("\nDifferences found:")
-            print(diff)
-            failed_tests.append(test_file.name)
-        
-        print("-" * 40)
+    # Start both interpreters on every test file; each run waits on a subprocess,
+    # so threads are enough to keep them running in parallel
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        myrpal_batch = executor.submit(run_myrpal_batch, test_files)
+        rpal_runs = [executor.submit(run_rpal_exe, test_file, use_cache) for test_file in test_files]
+        myrpal_outputs = myrpal_batch.result()
+
+        # Report each test file in order
+        for test_file, rpal_run, myrpal_output in zip(test_files, rpal_runs, myrpal_outputs):
+            test_name = os.path.basename(test_file)
+            print(f"\nTesting: {test_name}")
+            print("-" * 40)
+            
+            # Get the output of the original interpreter
+            rpal_output = rpal_run.result()
+            
+            # Compare and report results
+            passed, diff = compare_outputs(rpal_output, myrpal_output, test_name)
+            
+            if passed:
+                print("✅ PASSED")
+                passed_tests += 1
+            else:
+                print("❌ FAILED")
+                print("\nDifferences found:")
+                print(diff)
+                failed_tests.append(test_name)
+            
+            print("-" * 40)
     
     # Print test summary
     print("\n" + "=" * 80)
@@ -123,4 +282,8 @@ def run_tests():
             print(f"- {test}")
 
 if __name__ == "__main__":
-    run_tests() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Compare myrpal.py with the original RPAL interpreter")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Run rpal.exe on every test file instead of reusing saved outputs")
+    args = parser.parse_args()
+    run_tests(use_cache=not args.no_cache)
@@ -0,0 +1,26 @@
+import functools
+
+import pytest
+from src.lexer import Lexer, Token, TokenType
+
+@functools.lru_cache(maxsize=512)
+def tokenize_cached(code):
+    """Tokenize code once per distinct source; returns a tuple so the result can be shared."""
+    return tuple(Lexer(code).tokenize())
+
+@pytest.fixture(scope="session")
+def tokenize():
+    """Cached tokenizer shared by all tests that only read the tokens."""
+    return tokenize_cached
+
+@pytest.fixture(scope="session")
+def let_x_42_tokens():
+    """Hand-built token stream for `let x = 42;`, shared as a tuple so tests cannot mutate it."""
+    return (
+        Token(TokenType.KEYWORD, 'let', 1, 0),
+        Token(TokenType.IDENTIFIER, 'x', 1, 4),
+        Token(TokenType.OPERATOR, '=', 1, 6),
+        Token(TokenType.INTEGER, 42, 1, 8),
+        Token(TokenType.PUNCTUATION, ';', 1, 10),
+        Token(TokenType.EOF, 'EOF', 1, 11),
+    )
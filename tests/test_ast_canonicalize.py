@@ -0,0 +1,36 @@
+import pytest
+from src.lexer import Lexer
+from src.parser import Parser
+from src.ast_canonicalize import canonicalize
+import myrpal
+
+def parse(code):
+    return Parser(Lexer(code).tokenize()).parse()
+
+def shape(node):
+    """Nested (label, children...) tuples of a tree, for easy comparison."""
+    return (node.data, *(shape(child) for child in node.children))
+
+@pytest.mark.parametrize("code, folded", [
+    ("1 + 2", "<INT:3>"),
+    ("1 - 5", "<INT:-4>"),
+    ("(1 + 2) - 3", "<INT:0>"),
+    ("-(-3)", "<INT:3>"),
+])
+def test_folds_integer_literals(code, folded):
+    root = canonicalize(parse(code))
+    assert shape(root) == (folded,)
+
+@pytest.mark.parametrize("code", ["x + 1", "-(-x)"])
+def test_leaves_non_literal_operands(code):
+    assert shape(canonicalize(parse(code))) == shape(parse(code))
+
+def test_st_output_is_not_folded(tmp_path, capsys):
+    program = tmp_path / "add.rpal"
+    program.write_text("let x = 1 + 2 in Print x\n")
+
+    myrpal.run_program(str(program), st_only=True)
+    assert ".+\n..<INT:1>\n..<INT:2>\n" in capsys.readouterr().out
+
+    myrpal.run_program(str(program))
+    assert capsys.readouterr().out.strip() == "3"
@@ -0,0 +1,36 @@
+import subprocess
+
+import test_interpreter
+
+def fake_run(stdout):
+    """Returns a subprocess.run replacement whose process printed stdout."""
+    def run(args, **kwargs):
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr=b"")
+    return run
+
+def test_crlf_output_matches_lf_output(monkeypatch, tmp_path):
+    monkeypatch.setattr(test_interpreter, "CACHE_DIR", tmp_path)
+    program = tmp_path / "print2.rpal"
+    program.write_text("Print 1")
+
+    # Cygwin rpal.exe writes \n, myrpal.py on Windows writes \r\n
+    monkeypatch.setattr(subprocess, "run", fake_run(b"1\n2\n3\n"))
+    original = test_interpreter.run_rpal_exe(str(program), use_cache=False)
+    monkeypatch.setattr(subprocess, "run", fake_run(b"1\r\n2\r\n3\r\n\x1e"))
+    [mine] = test_interpreter.run_myrpal_batch([str(program)])
+
+    assert original == mine == b"1\n2\n3"
+    assert test_interpreter.compare_outputs(original, mine, "print2.rpal") == (True, "")
+
+    # A cache entry saved with \r\n endings reads back normalized
+    [cache_file] = tmp_path.glob("*.out")
+    cache_file.write_bytes(b"1\r\n2\r\n3\r\n")
+    assert test_interpreter.run_rpal_exe(str(program)) == b"1\n2\n3"
+
+def test_batch_falls_back_to_single_runs(monkeypatch):
+    # The batch process died during the second program, after partial output
+    monkeypatch.setattr(subprocess, "run", fake_run(b"first\x1epart"))
+    monkeypatch.setattr(test_interpreter, "run_myrpal", lambda file_path: b"single " + file_path.encode())
+
+    outputs = test_interpreter.run_myrpal_batch(["a.rpal", "b.rpal", "c.rpal"])
+    assert outputs == [b"first", b"single b.rpal", b"single c.rpal"]
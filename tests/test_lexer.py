@@ -1,13 +1,13 @@
 import pytest
 from src.lexer import Lexer, TokenType
 
-def get_token_types(code):
+def get_token_types(tokenize, code):
     """Helper to return a list of token types from code."""
-    return [token.type for token in Lexer(code).tokenize()]
+    return [token.type for token in tokenize(code)]
 
-def test_let_expression():
+def test_let_expression(tokenize):
     code = "let X = 42 in X"
-    tokens = Lexer(code).tokenize()
+    tokens = tokenize(code)
 
     assert tokens[0].type == TokenType.KEYWORD and tokens[0].value == "let"
     assert tokens[1].type == TokenType.IDENTIFIER and tokens[1].value == "X"
@@ -17,16 +17,16 @@ def test_let_expression():
     assert tokens[5].type == TokenType.IDENTIFIER and tokens[5].value == "X"
     assert tokens[-1].type == TokenType.EOF
 
-def test_string_literal():
+def test_string_literal(tokenize):
     code = "'hello'"
-    tokens = Lexer(code).tokenize()
+    tokens = tokenize(code)
     assert tokens[0].type == TokenType.STRING
     assert tokens[0].value == "hello"
     assert tokens[-1].type == TokenType.EOF
 
-def test_skips_whitespace_and_comments():
+def test_skips_whitespace_and_comments(tokenize):
     code = "let X = 10 // this is a comment\n in X"
-    token_types = get_token_types(code)
+    token_types = get_token_types(tokenize, code)
     assert token_types == [
         TokenType.KEYWORD,    # let
         TokenType.IDENTIFIER, # X
@@ -41,9 +41,9 @@ def test_raises_on_illegal_character():
     with pytest.raises(SyntaxError):
         Lexer("let X = `42").tokenize()  # '@' is not a valid token
 
-def test_function_call_with_punctuation():
+def test_function_call_with_punctuation(tokenize):
     code = "Print(X, 'hello')"
-    tokens = Lexer(code).tokenize()
+    tokens = tokenize(code)
 
     assert tokens[0].type == TokenType.IDENTIFIER
     assert tokens[1].type == TokenType.PUNCTUATION and tokens[1].value == "("
@@ -53,3 +53,17 @@ def test_function_call_with_punctuation():
     assert tokens[5].type == TokenType.PUNCTUATION and tokens[5].value == ")"
     assert tokens[-1].type == TokenType.EOF
 
+
+def test_token_stream_sequence():
+    tokens = Lexer("let X = 42\nin X").tokenize()
+
+    assert len(tokens) == 7
+    assert tokens[-1].type == TokenType.EOF
+    assert tokens[-2].value == "X"
+    assert [token.value for token in tokens[1:4]] == ["X", "=", 42]
+    assert [token.value for token in tokens] == ["let", "X", "=", 42, "in", "X", "EOF"]
+
+    # Tokens built from the parallel arrays keep their values and positions
+    token = tokens[4]
+    assert (token.type, token.value, token.line, token.column) == (TokenType.KEYWORD, "in", 2, 1)
+    assert [(t.line, t.column) for t in tokens][:4] == [(1, 1), (1, 5), (1, 7), (1, 9)]
@@ -0,0 +1,31 @@
+import io
+import sys
+
+import myrpal
+from src.cse_machine.data_structures.enviroment import Environment
+
+def test_batch_records(monkeypatch, capsys, tmp_path):
+    programs = []
+    for name, code in [("one", "Print 1"), ("broken", "let x = in x"), ("two", "Print (1, 2)")]:
+        program = tmp_path / f"{name}.rpal"
+        program.write_text(code)
+        programs.append(str(program))
+
+    # Record the environment counter each program starts from
+    start_indices = []
+    run_program = myrpal.run_program
+    def spy(*args):
+        start_indices.append(Environment.index)
+        run_program(*args)
+    monkeypatch.setattr(myrpal, "run_program", spy)
+
+    Environment.index = 5
+    monkeypatch.setattr(sys, "stdin", io.StringIO("".join(f"{p}\n" for p in programs)))
+    myrpal.run_batch()
+
+    records = capsys.readouterr().out.split(myrpal.BATCH_SEPARATOR)
+    assert len(records) == 4 and records[-1] == ""
+    assert records[0].strip() == "1"
+    assert records[1].startswith(myrpal.BATCH_ERROR) and "SyntaxError" in records[1]
+    assert records[2].strip() == "(1, 2)"
+    assert start_indices == [-1, -1, -1]
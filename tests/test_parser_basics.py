@@ -1,19 +1,10 @@
 import pytest
-from src.lexer import Token, TokenType
+from src.lexer import TokenType
 from src.parser import Parser
 
-def test_parser_token_matching():
-    # Simulated token stream: let x = 42;
-    tokens = [
-        Token(TokenType.KEYWORD, 'let', 1, 0),
-        Token(TokenType.IDENTIFIER, 'x', 1, 4),
-        Token(TokenType.OPERATOR, '=', 1, 6),
-        Token(TokenType.INTEGER, 42, 1, 8),
-        Token(TokenType.PUNCTUATION, ';', 1, 10),
-        Token(TokenType.EOF, 'EOF', 1, 11),
-    ]
-
-    parser = Parser(tokens)
+def test_parser_token_matching(let_x_42_tokens):
+    # Simulated token stream: let x = 42; only the parser is rebuilt per test
+    parser = Parser(list(let_x_42_tokens))
 
     # Assertions to ensure match works
     token = parser.match(TokenType.KEYWORD, 'let')
@@ -33,3 +24,20 @@ def test_parser_token_matching():
 
     token = parser.match(TokenType.EOF)
     assert token.value == 'EOF'
+
+def test_parser_expect(let_x_42_tokens):
+    parser = Parser(list(let_x_42_tokens))
+
+    # expect consumes the token like match but returns only its value
+    assert parser.expect(TokenType.KEYWORD, 'let') == 'let'
+    assert parser.expect(TokenType.IDENTIFIER) == 'x'
+    assert parser.pos == 2
+
+    # A mismatch raises the same error as match and leaves the position alone
+    with pytest.raises(SyntaxError) as expect_error:
+        parser.expect(TokenType.OPERATOR, '==')
+    with pytest.raises(SyntaxError) as match_error:
+        parser.match(TokenType.OPERATOR, '==')
+    assert str(expect_error.value) == str(match_error.value)
+    assert "Unexpected token '=' at line 1, column 6" in str(expect_error.value)
+    assert parser.pos == 2
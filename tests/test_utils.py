@@ -0,0 +1,46 @@
+from src.rpal_ast import ASTNode
+from src.utils import ENTER, EXIT, flatten_ast, get_children, get_children_tuple, set_children
+
+def make_tree(label, *children):
+    """Builds an LCRS tree from a label and already built subtrees."""
+    node = ASTNode(label)
+    set_children(node, list(children))
+    return node
+
+def test_flatten_ast_order():
+    # gamma(lambda(x, +(x, 1)), 2)
+    root = make_tree('gamma',
+                     make_tree('lambda', make_tree('x'), make_tree('+', make_tree('x'), make_tree('1'))),
+                     make_tree('2'))
+
+    flat = [(op, node.label) for op, node in flatten_ast(root)]
+    assert flat == [
+        (ENTER, 'gamma'),
+        (ENTER, 'lambda'),
+        (ENTER, 'x'), (EXIT, 'x'),
+        (ENTER, '+'),
+        (ENTER, 'x'), (EXIT, 'x'),
+        (ENTER, '1'), (EXIT, '1'),
+        (EXIT, '+'),
+        (EXIT, 'lambda'),
+        (ENTER, '2'), (EXIT, '2'),
+        (EXIT, 'gamma'),
+    ]
+
+    # Every node is entered and exited exactly once, properly nested
+    open_nodes = []
+    for op, node in flatten_ast(root):
+        if op == ENTER:
+            open_nodes.append(node)
+        else:
+            assert open_nodes.pop() is node
+    assert not open_nodes
+
+def test_flatten_ast_empty():
+    assert flatten_ast(None) == []
+
+def test_get_children_tuple():
+    for n in range(5):
+        children = [make_tree(str(i)) for i in range(n)]
+        node = make_tree('tau', *children)
+        assert get_children_tuple(node) == tuple(children) == tuple(get_children(node))